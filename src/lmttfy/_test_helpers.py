@@ -31,3 +31,21 @@ async def async_raise_value_error(msg: str = "boom") -> float:
     import asyncio
     await asyncio.sleep(0.01)
     raise ValueError(msg)
+
+
+def exit_abruptly(code: int = 3) -> None:
+    """Terminate the current process immediately without unwinding."""
+    import os
+    os._exit(code)
+
+
+class TwoArgError(Exception):
+    """An exception that pickles but can not be unpickled, its ``__init__`` needs arguments ``args`` lacks."""
+
+    def __init__(self, a, b):
+        super().__init__(f"{a} {b}")
+
+
+def raise_two_arg_error() -> None:
+    """Always raise :exc:`TwoArgError`."""
+    raise TwoArgError(1, 2)
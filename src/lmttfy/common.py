@@ -1,5 +1,7 @@
 import inspect
-from typing import Any, Callable, TypeVar
+import threading
+import weakref
+from typing import Any, Callable, Iterator, TypeVar
 
 CALL_STATE_INCOMPLETE: int = 0
 CALL_STATE_SUCCESS: int = 1
@@ -15,6 +17,99 @@ def pass_(*args, **kwargs):
     pass
 
 
+# ---------------------------------------------------------------------------
+# per-function concurrency counters
+# ---------------------------------------------------------------------------
+
+class CallCounter:
+    """Number of in-flight capped calls for a single function.
+
+    Every capped decoration of the function shares the counter and checks it
+    against its own limit. Each counter carries its own lock so the
+    check-and-increment done on every call only serialises calls to the *same*
+    function, never unrelated ones. Slots keep every counter a small, separate
+    allocation with no ``__dict__``. Uncapped calls do not touch a counter at
+    all, and capped ones keep an exact count instead of batching per-thread
+    deltas: every increment is a limit check, so a delayed flush would let
+    calls slip past the limit.
+    """
+
+    __slots__ = ('_lock', 'value')
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value: int = 0
+
+    def try_increment(self, limit: int) -> bool:
+        """Increment the counter unless it already reached *limit*.
+
+        Returns ``True`` if the slot was taken, ``False`` if the limit was hit.
+        """
+        with self._lock:
+            if self.value >= limit:
+                return False
+            self.value += 1
+            return True
+
+    def decrement(self) -> None:
+        """Release one slot, never dropping below zero."""
+        with self._lock:
+            if self.value > 0:
+                self.value -= 1
+
+    def reset(self) -> None:
+        """Start over with a fresh lock and no in-flight calls.
+
+        Used in forked children: the parent's calls are not the child's, and
+        the inherited lock may have been held by a parent thread at fork time.
+        """
+        self._lock = threading.Lock()
+        self.value = 0
+
+
+def get_call_counter(counters: dict[int, CallCounter], lock: Any, function: Callable) -> CallCounter:
+    """Return the counter of *function* in *counters*, creating it under *lock*.
+
+    The counter is keyed by ``id(function)`` and shared by every capped
+    decoration of it. It is removed again once *function* is garbage
+    collected, so a later object reusing that id never inherits it.
+    """
+    fid = id(function)
+    with lock:
+        counter = counters.get(fid)
+        if counter is not None:
+            return counter
+        counter = counters[fid] = CallCounter()
+    try:
+        weakref.finalize(function, counters.pop, fid, None)
+    except TypeError:
+        # builtins can not be weakly referenced, but they also never go away
+        pass
+    return counter
+
+
+# ---------------------------------------------------------------------------
+# polling
+# ---------------------------------------------------------------------------
+
+def backoff_delays(first: float, longest: float) -> Iterator[float]:
+    """Yield polling intervals that start at *first* and double up to *longest*.
+
+    Waits on work that finishes quickly notice completion within a short
+    interval, while long waits settle on *longest* and stay cheap.
+
+    *first* must be positive: a zero interval would never grow, and a zero
+    sleep does not reliably deschedule the poller, so it would busy-spin and
+    starve the threads it is waiting on.
+    """
+    if first <= 0:
+        raise ValueError(f"first polling interval must be positive, got {first!r}")
+    delay = first
+    while True:
+        yield delay
+        delay = min(delay * 2, longest)
+
+
 # ---------------------------------------------------------------------------
 # callback invocation helpers (sync + async aware)
 # ---------------------------------------------------------------------------
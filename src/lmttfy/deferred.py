@@ -1,8 +1,6 @@
 """Redis/Valkey-backed deferred task execution and the ``@deferred_call`` decorator."""
 
 import base64
-import itertools
-import json
 import logging
 import os
 import pickle
@@ -16,6 +14,7 @@ from functools import wraps
 from typing import Any, Callable, List, Optional
 
 from .common import CALL_STATE_INCOMPLETE, CALL_STATE_SUCCESS, CALL_STATE_ERROR, pass_, invoke_callback_sync, invoke_callback_async
+from .common import backoff_delays
 from .exceptions import BurstWhileNoTaskErrorsException
 from .task import LMTTask
 
@@ -309,13 +308,14 @@ class ExternallyDeferredCall:
             deadline = None
             if timeout > 0:
                 deadline = time.monotonic() + timeout
+            delays = backoff_delays(0.001, 0.05)
             while True:
                 with self._lock:
                     if self._state != CALL_STATE_INCOMPLETE:
                         return self._result
                 if deadline is not None and time.monotonic() >= deadline:
                     return None
-                await asyncio.sleep(0.05)
+                await asyncio.sleep(next(delays))
         else:
             # remote: async poll with run_in_executor for redis calls
             return await self._async_poll_result(timeout=timeout)
@@ -424,6 +424,7 @@ class ExternallyDeferredCall:
         deadline = None
         if timeout > 0:
             deadline = time.monotonic() + timeout
+        delays = backoff_delays(0.01, 0.1)
         while True:
             with self._lock:
                 if self._state == CALL_STATE_SUCCESS:
@@ -455,7 +456,7 @@ class ExternallyDeferredCall:
 
             if deadline is not None and time.monotonic() >= deadline:
                 return None
-            time.sleep(0.1)
+            time.sleep(next(delays))
 
     async def _async_poll_result(self, timeout: float = 0) -> Any:
         """Async variant of _poll_result — uses asyncio.sleep and
@@ -468,6 +469,7 @@ class ExternallyDeferredCall:
         deadline = None
         if timeout > 0:
             deadline = time.monotonic() + timeout
+        delays = backoff_delays(0.01, 0.1)
         while True:
             with self._lock:
                 if self._state == CALL_STATE_SUCCESS:
@@ -501,13 +503,14 @@ class ExternallyDeferredCall:
 
             if deadline is not None and time.monotonic() >= deadline:
                 return None
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(next(delays))
 
     def _poll_celery_result(self, timeout: float = 0) -> Any:
         """Poll Celery ``AsyncResult`` until the task completes."""
         deadline = None
         if timeout > 0:
             deadline = time.monotonic() + timeout
+        delays = backoff_delays(0.01, 0.1)
         while True:
             with self._lock:
                 if self._state != CALL_STATE_INCOMPLETE:
@@ -531,7 +534,7 @@ class ExternallyDeferredCall:
                 invoke_callback_sync(self._on_error, exc)
                 raise exc
 
-            time.sleep(0.1)
+            time.sleep(next(delays))
 
     async def _async_poll_celery_result(self, timeout: float = 0) -> Any:
         """Async variant — poll Celery ``AsyncResult`` without blocking the event loop."""
@@ -540,6 +543,7 @@ class ExternallyDeferredCall:
         deadline = None
         if timeout > 0:
             deadline = time.monotonic() + timeout
+        delays = backoff_delays(0.01, 0.1)
         while True:
             with self._lock:
                 if self._state != CALL_STATE_INCOMPLETE:
@@ -563,7 +567,7 @@ class ExternallyDeferredCall:
                     self._state = CALL_STATE_ERROR
                 raise exc
 
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(next(delays))
 
 
 # ---------------------------------------------------------------------------
@@ -1,9 +1,12 @@
-from queue import Empty
 from .exceptions import MaxConcurrentCallsLimitExceedException, BurstWhileNoTaskErrorsException
-from .common import CALL_STATE_INCOMPLETE, CALL_STATE_SUCCESS, CALL_STATE_ERROR, R, pass_, invoke_callback_sync
+from .common import CALL_STATE_INCOMPLETE, CALL_STATE_SUCCESS, CALL_STATE_ERROR, R, pass_, invoke_callback_sync, \
+    backoff_delays, CallCounter, get_call_counter
 from .task import LMTTask
-from typing import Callable, Any, Tuple
+from .thread import _WORKER_POOL
+from multiprocessing.connection import Connection, wait as wait_for_connections
+from typing import Callable, Any, NamedTuple, Optional, Tuple
 from functools import wraps
+import importlib
 import os
 import signal
 import subprocess
@@ -11,26 +14,361 @@ import platform
 import multiprocessing
 import threading
 import logging
+import sys
 import time
 
+logger = logging.getLogger(__name__)
+
 # multiprocessing related global variables
-PROCESS_CALL_COUNTER_LOCK = multiprocessing.Lock()
-PROCESS_CALL_COUNTER: dict[int, int] = {}
+# the lock only guards creating the counter of a newly capped function, each counter synchronises itself
+PROCESS_CALL_COUNTER_LOCK = threading.Lock()
+PROCESS_CALL_COUNTER: dict[int, CallCounter] = {}
+
+# maximum number of idle worker processes kept around for invoke_in_sp(reuse_process=True) calls
+PROCESS_POOL_MAX_IDLE: int = os.cpu_count() or 1
 
+# bytes, bytearray and numpy array results at least this large are returned through shared memory, not the pipe,
+# POSIX only: on Windows the block is gone as soon as the sub-process closes it, before the parent can attach
+SHARED_MEMORY_THRESHOLD: int = 4 * 1024 * 1024
 
-def mp_exec_wrapper(function: Callable[..., Any], queue: multiprocessing.Queue, *args, **kwargs) -> None:
+
+class _FunctionRef(NamedTuple):
+    """
+    Picklable by-name reference to a function whose module attribute is its own lmttfy wrapper
+    """
+    module: str
+    qualname: str
+
+    def resolve(self) -> Callable:
+        obj = importlib.import_module(self.module)
+        for part in self.qualname.split("."):
+            obj = getattr(obj, part)
+        return getattr(obj, "__wrapped__", obj)
+
+
+def _function_ref(function: Callable) -> Callable | _FunctionRef:
+    """
+    Returns something that pickles to function: the function itself, or a _FunctionRef when the name it would be
+    pickled by is bound to the @invoke_in_sp() wrapper (plain pickling rejects that as "not the same object")
+    """
+    obj = sys.modules.get(function.__module__)
+    for part in function.__qualname__.split("."):
+        obj = getattr(obj, part, None)
+    if obj is not function and getattr(obj, "__wrapped__", None) is function:
+        return _FunctionRef(function.__module__, function.__qualname__)
+    return function
+
+
+def _exec_and_send(function: Callable[..., Any], conn: Connection, args: tuple, kwargs: dict) -> None:
+    """
+    Executes the function and sends its return value or exception over conn
     """
-            This method gets processed and called to execute the actual function
-            """
     try:
         import asyncio, inspect
         if inspect.iscoroutinefunction(function):
             fc_ret = asyncio.run(function(*args, **kwargs))
         else:
             fc_ret = function(*args, **kwargs)
-        queue.put(("success_set", fc_ret))
+        reply = _shared_memory_reply(fc_ret)
+        conn.send(reply if reply is not None else ("success_set", fc_ret))
     except Exception as e:
-        queue.put(("exception_set", e))
+        conn.send(("exception_set", e))
+
+
+def _shared_memory_reply(fc_ret: Any) -> Optional[tuple]:
+    """
+    Copies a large bytes, bytearray or numpy array return value into a new shared memory block and returns the
+    message describing it, the parent copies the value out and unlinks the block.
+    Returns None when the value should simply be pickled over the pipe, which is always the case off POSIX.
+    """
+    if os.name != "posix":
+        return None
+    # numpy is optional, a function can only have returned an array if it is already imported
+    np = sys.modules.get("numpy")
+    if type(fc_ret) in (bytes, bytearray):
+        kind, nbytes, layout = type(fc_ret).__name__, len(fc_ret), None
+    elif np is not None and type(fc_ret) is np.ndarray and not fc_ret.dtype.hasobject:
+        kind, nbytes, layout = "ndarray", fc_ret.nbytes, (fc_ret.shape, fc_ret.dtype)
+    else:
+        return None
+    if nbytes < SHARED_MEMORY_THRESHOLD:
+        return None
+    from multiprocessing import resource_tracker, shared_memory
+    try:
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    except OSError:
+        return None
+    if kind == "ndarray":
+        view = np.ndarray(layout[0], layout[1], buffer=shm.buf)
+        view[...] = fc_ret
+        del view
+    else:
+        shm.buf[:nbytes] = fc_ret
+    shm.close()
+    # hand ownership to the parent, it registers the block again when attaching and unlinks it after reading
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return "success_shm", shm.name, kind, nbytes, layout
+
+
+def _read_shared_memory_reply(name: str, kind: str, nbytes: int, layout: Optional[tuple]) -> Any:
+    """
+    Rebuilds a return value sent by _shared_memory_reply and releases its shared memory block
+    """
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        if kind == "ndarray":
+            import numpy
+            view = numpy.ndarray(layout[0], layout[1], buffer=shm.buf)
+            fc_ret = view.copy()
+            del view
+        else:
+            with shm.buf[:nbytes] as view:
+                fc_ret = bytes(view) if kind == "bytes" else bytearray(view)
+    finally:
+        shm.close()
+        shm.unlink()
+    return fc_ret
+
+
+def mp_exec_wrapper(function: Callable[..., Any], conn: Connection, *args, **kwargs) -> None:
+    """
+            This method gets processed and called to execute the actual function
+            """
+    try:
+        _exec_and_send(function, conn, args, kwargs)
+    finally:
+        conn.close()
+
+
+def mp_worker_loop(conn: Connection) -> None:
+    """
+    Main loop of a pooled sub-process, executes jobs received over conn until told to stop or the parent goes away
+    """
+    while True:
+        try:
+            job = conn.recv()
+            if job is None:
+                return
+            function = job[0].resolve() if isinstance(job[0], _FunctionRef) else job[0]
+        except EOFError:
+            return
+        except Exception as e:
+            # the job refers to something this long-lived process never saw (e.g. defined after it was forked),
+            # the parent re-runs it in a dedicated sub-process instead
+            conn.send(("job_unloadable", repr(e)))
+            continue
+        _exec_and_send(function, conn, job[1], job[2])
+
+
+class _PooledProcess:
+    """
+    A reusable worker sub-process and the parent's end of its duplex pipe
+    """
+
+    __slots__ = ('process', 'conn')
+
+    def __init__(self):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=mp_worker_loop, args=(child_conn,))
+        self.process.daemon = True
+        self.process.start()
+        child_conn.close()
+
+    def stop(self) -> None:
+        """
+        Asks the worker to exit, it finishes on its own so this never blocks
+        """
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+
+
+class _ProcessPool:
+    """
+    Keeps idle worker sub-processes around so calls do not pay the process start-up cost every time
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__idle: list[_PooledProcess] = []
+
+    def submit(self, function: Callable, args: tuple, kwargs: dict) -> Optional[_PooledProcess]:
+        """
+        Sends the job to an idle (or new) worker and returns it, the result arrives on worker.conn.
+        Returns None if the job can not be pickled, callers then fall back to a dedicated sub-process.
+        """
+        worker = None
+        with self.__lock:
+            while self.__idle and worker is None:
+                worker = self.__idle.pop()
+                if not worker.process.is_alive():
+                    worker.conn.close()
+                    worker = None
+        if worker is None:
+            worker = _PooledProcess()
+        try:
+            # the job is pickled in full before anything is written, so a failure leaves the pipe clean
+            worker.conn.send((_function_ref(function), args, kwargs))
+        except Exception:
+            self.release(worker)
+            return None
+        return worker
+
+    def release(self, worker: _PooledProcess) -> None:
+        """
+        Returns an idle worker to the pool, or stops it if the pool is full
+        """
+        with self.__lock:
+            if len(self.__idle) < PROCESS_POOL_MAX_IDLE:
+                self.__idle.append(worker)
+                return
+        worker.stop()
+
+    def reset(self) -> None:
+        """
+        Forgets all workers, used in a forked child where the parent's workers are not ours to reuse
+        """
+        self.__lock = threading.Lock()
+        self.__idle = []
+
+
+# result pipes one dispatcher thread waits on, WaitForMultipleObjects() takes at most 64 handles and one of them is
+# the thread's wake-up pipe
+_WAIT_BATCH_SIZE = 63
+
+
+class _DispatchThread:
+    """
+    One thread of the _ResultDispatcher, the result pipes it waits on and its wake-up pipe
+    """
+
+    __slots__ = ('pending', 'wake_r', 'wake_w', 'woken')
+
+    def __init__(self):
+        self.pending: dict[Connection, Callable[[Optional[tuple]], None]] = {}
+        self.wake_r, self.wake_w = multiprocessing.Pipe(duplex=False)
+        self.woken: bool = False
+
+
+class _ResultDispatcher:
+    """
+    Background threads that wait on the result pipes of every outstanding MultiProcessedCall, instead of parking one
+    sync thread per call. A single thread serves up to _WAIT_BATCH_SIZE pipes, more threads are started only while
+    more calls are outstanding. Handlers only get the received message, so they should hand any real work off
+    elsewhere and return quickly.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def register(self, conn: Connection, handler: Callable[[Optional[tuple]], None]) -> None:
+        """
+        Calls handler(message) once conn becomes readable, message is None if the other end closed without a reply
+        """
+        with self.__lock:
+            for shard in self.__threads:
+                if len(shard.pending) < _WAIT_BATCH_SIZE:
+                    break
+            else:
+                shard = _DispatchThread()
+                shard.pending[conn] = handler
+                self.__threads.append(shard)
+                threading.Thread(target=self.__run, args=(shard,), daemon=True).start()
+                return
+            shard.pending[conn] = handler
+            if not shard.woken:
+                # interrupt the current wait so it picks up the new connection
+                shard.woken = True
+                shard.wake_w.send_bytes(b"")
+
+    def reset(self) -> None:
+        """
+        Forgets all state, used in a forked child where the parent's dispatcher threads do not exist
+        """
+        self.__lock = threading.Lock()
+        self.__threads: list[_DispatchThread] = []
+
+    def __run(self, shard: _DispatchThread) -> None:
+        """
+        Dispatcher thread loop
+        """
+        while True:
+            with self.__lock:
+                conns = list(shard.pending)
+            try:
+                ready = wait_for_connections(conns + [shard.wake_r])
+            except Exception as e:
+                self.__fail_broken(shard, conns, e)
+                continue
+            for conn in ready:
+                if conn is shard.wake_r:
+                    with self.__lock:
+                        while shard.wake_r.poll():
+                            shard.wake_r.recv_bytes()
+                        shard.woken = False
+                    continue
+                with self.__lock:
+                    handler = shard.pending.pop(conn)
+                try:
+                    cmd = conn.recv()
+                except EOFError:
+                    cmd = None
+                except Exception as e:
+                    # the reply arrived but could not be loaded here, e.g. an exception class with a custom __init__
+                    cmd = ("exception_set", e)
+                self.__dispatch(handler, cmd)
+
+    def __fail_broken(self, shard: _DispatchThread, conns: list, error: Exception) -> None:
+        """
+        Drops the connections a wait failed on and fails their calls, so the same error can not come back forever
+        """
+        broken = []
+        for conn in conns:
+            try:
+                wait_for_connections([conn], timeout=0)
+            except Exception as e:
+                broken.append((conn, e))
+        if not broken:
+            # no single connection is at fault, fail them all rather than retry the same wait
+            broken = [(conn, error) for conn in conns]
+        logger.debug("Waiting on result pipes failed, dropping %s of them: %r", len(broken), error)
+        for conn, e in broken:
+            with self.__lock:
+                handler = shard.pending.pop(conn)
+            self.__dispatch(handler, ("exception_set", e))
+
+    @staticmethod
+    def __dispatch(handler: Callable[[Optional[tuple]], None], cmd: Optional[tuple]) -> None:
+        """
+        Calls handler(cmd), a failing handler is logged and must not take the dispatcher thread down with it
+        """
+        try:
+            handler(cmd)
+        except Exception:
+            logger.exception("Result handler failed")
+
+
+_PROCESS_POOL = _ProcessPool()
+_RESULT_DISPATCHER = _ResultDispatcher()
+
+
+def _reset_after_fork() -> None:
+    """
+    Gives a forked child fresh locks, idle counters, no pooled workers and no dispatcher, none of them are its own
+    """
+    global PROCESS_CALL_COUNTER_LOCK
+    PROCESS_CALL_COUNTER_LOCK = threading.Lock()
+    for counter in PROCESS_CALL_COUNTER.values():
+        counter.reset()
+    _PROCESS_POOL.reset()
+    _RESULT_DISPATCHER.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 class MultiProcessedCall:
@@ -39,35 +377,65 @@ class MultiProcessedCall:
     or raise the Exception that occurred in the process to handle it properly
     """
 
-    def __init__(self, function: Callable, fid: int, terminate_on_return: bool = False, *args, **kwargs):
+    __slots__ = ('__exception', '__fc_ret', '__state', '__fid', '__tor', '__counter', '__onComplete', '__onError',
+                 '__result_set', '__done', '__worker', '__job', '__parent_conn', 'process', '__weakref__')
+
+    def __init__(self, function: Callable, fid: int, counter: Optional[CallCounter], terminate_on_return: bool = False,
+                 reuse_process: bool = False, /, *args, **kwargs):
         """
-        Initializes the MultiProcessedCall object
+        Initializes the MultiProcessedCall object, the leading parameters are positional-only so that any keyword
+        argument reaches the function
+        :param counter: Concurrency counter of the function, None when this call is uncapped
+        :param reuse_process: Run in a pooled worker sub-process instead of forking a new one for this call
         """
-        self.__exception: Exception = BurstWhileNoTaskErrorsException(
-            "Burst called with no error on multiprocessing task")
-        self.__fid: int = 0
+        self.__exception: Optional[Exception] = None
         self.__fc_ret = None
         self.__state = CALL_STATE_INCOMPLETE
-        self.__fid = fid
+        self.__fid: int = fid
         self.__tor = terminate_on_return
-        self.__ipcq = multiprocessing.Queue()
+        self.__counter: Optional[CallCounter] = counter
         self.__onComplete: Callable[[Any], None] = pass_
         self.__onError: Callable[[Any], None] = pass_
-        self.__sync_thread = threading.Thread(target=self.__sync_state)
-        self.__sync_thread.daemon = True
-        self.__sync_thread.start()
-        logging.info("Inter process syncing thread started for fid: %s", self.__fid)
-        self.process = multiprocessing.Process(target=mp_exec_wrapper, args=(function, self.__ipcq,) + args, kwargs=kwargs)
+        # set as soon as the return value or exception is recorded, before callbacks run
+        self.__result_set: threading.Event = threading.Event()
+        # set once the result is in and callbacks and the counter bookkeeping are all done
+        self.__done: threading.Event = threading.Event()
+        # a sub-process that gets terminated on return can not be reused, neither can a job that does not pickle
+        self.__worker: Optional[_PooledProcess] = None
+        # kept while a pooled worker has the job, in case it can not load it and it has to run in a dedicated process
+        self.__job: Optional[tuple] = None
+        if reuse_process and not terminate_on_return:
+            self.__worker = _PROCESS_POOL.submit(function, args, kwargs)
+        if self.__worker is not None:
+            self.__job = (function, args, kwargs)
+            # the pooled worker goes on to run other calls, so it is not exposed as this call's process
+            self.process: Optional[multiprocessing.Process] = None
+            self.__parent_conn = self.__worker.conn
+            logger.debug('Job sent to pooled sub-process for fid: %s', self.__fid)
+            _RESULT_DISPATCHER.register(self.__parent_conn, self.__on_result)
+        else:
+            self.__start_dedicated(function, args, kwargs)
+
+    def __start_dedicated(self, function: Callable, args: tuple, kwargs: dict) -> None:
+        """
+        Runs the job in a sub-process of its own, used when a pooled worker can not (or should not) run it
+        """
+        self.__parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(target=mp_exec_wrapper, args=(function, child_conn,) + args,
+                                               kwargs=kwargs)
         self.process.daemon = True
         self.process.start()
-        logging.info('Sub-process started for fid: %s', self.__fid)
+        # drop our copy of the write end so recv() sees EOF if the sub-process dies without replying
+        child_conn.close()
+        logger.debug('Sub-process started for fid: %s', self.__fid)
+        _RESULT_DISPATCHER.register(self.__parent_conn, self.__on_result)
 
     def on_complete(self, func: Callable, immediate_callback_if_done: bool = True):
         """
         Sets the function which gets passed the return value from the multiprocessing function after it's done
         """
         self.__onComplete = func
-        if self.__state == CALL_STATE_SUCCESS and immediate_callback_if_done:
+        if self.__result_set.is_set() and self.__state == CALL_STATE_SUCCESS and immediate_callback_if_done:
             invoke_callback_sync(func, self.__fc_ret)
         return self
 
@@ -76,7 +444,7 @@ class MultiProcessedCall:
         Sets the function which will be called when the function call in the process raises any unhandled exceptions
         """
         self.__onError = func
-        if self.__state == CALL_STATE_ERROR and immediate_callback_if_done:
+        if self.__result_set.is_set() and self.__state == CALL_STATE_ERROR and immediate_callback_if_done:
             invoke_callback_sync(func, self.__exception)
         return self
 
@@ -84,18 +452,15 @@ class MultiProcessedCall:
         """
         Raises the captured exception during execution of the function in a different process
         """
+        if self.__exception is None:
+            raise BurstWhileNoTaskErrorsException("Burst called with no error on multiprocessing task")
         raise self.__exception
 
     def wait(self, timeout: float = 0) -> Any:
         """
         Wait for the wrapped function to return or error-out
         """
-        if self.__state == CALL_STATE_INCOMPLETE:
-            # sync thread terminates once we get error or return value
-            if timeout > 0:
-                self.__sync_thread.join(timeout=timeout)
-            else:
-                self.__sync_thread.join()
+        self.__done.wait(timeout=timeout if timeout > 0 else None)
         return self.__fc_ret
 
     async def async_wait(self, timeout: float = 0) -> Any:
@@ -105,79 +470,127 @@ class MultiProcessedCall:
         deadline = None
         if timeout > 0:
             deadline = time.monotonic() + timeout
-        while self.__state == CALL_STATE_INCOMPLETE:
+        delays = backoff_delays(0.001, 0.05)
+        while not self.__done.is_set():
             if deadline is not None and time.monotonic() >= deadline:
                 return None
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(next(delays))
         return self.__fc_ret
 
-    def __sync_state(self) -> None:
+    def __on_result(self, cmd: Optional[Tuple[str, str | object]]) -> None:
+        """
+        Called on the dispatcher thread with the sub-process reply, moves the actual handling to a worker thread
+        """
+        _WORKER_POOL.submit(self.__sync_state, cmd)
+
+    def __sync_state(self, cmd: Optional[Tuple[str, str | object]]) -> None:
         """
         Sync the state variable, and allow actions across between sub-process and current.
         :return: None
         """
-        while self.__state == CALL_STATE_INCOMPLETE:
+        if cmd is not None and cmd[0] == 'job_unloadable':
+            logger.debug("Pooled sub-process could not load the job, retrying in a dedicated one: fid=%s: %s",
+                         self.__fid, cmd[1])
+            _PROCESS_POOL.release(self.__worker)
+            self.__worker = None
+            function, args, kwargs = self.__job
+            self.__job = None
             try:
-                cmd: Tuple[str, str | object] = self.__ipcq.get(timeout=0.1)
-                if cmd[0] == 'success_set':
-                    logging.info("The sub-process returned successfully: fid=%s", self.__fid)
-                    self.__state = CALL_STATE_SUCCESS
-                    self.__fc_ret = cmd[1]
-                if cmd[0] == 'exception_set':
-                    logging.info("The sub-process errored out and set an exception: fid=%s", self.__fid)
-                    self.__state = CALL_STATE_ERROR
-                    self.__exception = cmd[1]
-                if cmd[0] in ['success_set', 'exception_set']:
-                    # the process returned or errored out
-                    # kill the process if required
-                    # the process may not die if it's stuck doing I/O stuff, handle it properly
-                    if self.__tor and self.process.is_alive():
-                        self.process.terminate()
-                        self.process.join(timeout=5)
-                        if self.process.is_alive():
-                            logging.error("Pesky sub-process is still alive, attempting to kill: fid=%s", self.__fid)
-                            # pesky process is still alive
-                            # if on linux/nix call os.kill with process.pid, and for windows handle differently
-                            if platform.system() == "Windows":
-                                subprocess.run(["taskkill", "/PID", str(self.process.pid), "/F"], check=True)
-                            else:
-                                os.kill(self.process.pid, signal.SIGKILL)
-                    # run on complete callbacks
-                    if self.__state == CALL_STATE_SUCCESS:
-                        invoke_callback_sync(self.__onComplete, self.__fc_ret)
-                    elif self.__state == CALL_STATE_ERROR:
-                        invoke_callback_sync(self.__onError, self.__exception)
-                    # clear the counter
-                    with PROCESS_CALL_COUNTER_LOCK:
-                        if PROCESS_CALL_COUNTER[self.__fid] > 0:
-                            logging.info("Decrementing process call counter: fid=%s", self.__fid)
-                            PROCESS_CALL_COUNTER[self.__fid] -= 1
-            except (TimeoutError, Empty):
-                pass
-
-
-def invoke_in_sp(max_concurrent_execs=-1, terminate_on_return=False):
+                self.__start_dedicated(function, args, kwargs)
+                return
+            except Exception as e:
+                cmd = ("exception_set", e)
+        self.__job = None
+        try:
+            self.__apply_result(cmd)
+        finally:
+            # release waiters even if a callback raised
+            self.__done.set()
+
+    def __apply_result(self, cmd: Optional[Tuple[str, str | object]]) -> None:
+        """
+        Records the sub-process reply, cleans the sub-process up and runs callbacks
+        """
+        if cmd is None:
+            # the sub-process died before it could report back (killed, crashed, os._exit ...)
+            process = self.process if self.__worker is None else self.__worker.process
+            self.__worker = None
+            process.join()
+            cmd = ("exception_set", ChildProcessError(
+                f"Sub-process exited with code {process.exitcode} without returning a result"))
+        if self.__worker is not None:
+            _PROCESS_POOL.release(self.__worker)
+            self.__worker = None
+        else:
+            self.__parent_conn.close()
+        if cmd[0] == 'success_shm':
+            try:
+                cmd = ("success_set", _read_shared_memory_reply(*cmd[1:]))
+            except Exception as e:
+                cmd = ("exception_set", e)
+        if cmd[0] == 'success_set':
+            logger.debug("The sub-process returned successfully: fid=%s", self.__fid)
+            self.__state = CALL_STATE_SUCCESS
+            self.__fc_ret = cmd[1]
+        if cmd[0] == 'exception_set':
+            logger.debug("The sub-process errored out and set an exception: fid=%s", self.__fid)
+            self.__state = CALL_STATE_ERROR
+            self.__exception = cmd[1]
+        self.__result_set.set()
+        # the process returned or errored out
+        # kill the process if required
+        # the process may not die if it's stuck doing I/O stuff, handle it properly
+        if self.__tor and self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                logger.error("Pesky sub-process is still alive, attempting to kill: fid=%s", self.__fid)
+                # pesky process is still alive
+                # if on linux/nix call os.kill with process.pid, and for windows handle differently
+                if platform.system() == "Windows":
+                    subprocess.run(["taskkill", "/PID", str(self.process.pid), "/F"], check=True)
+                else:
+                    os.kill(self.process.pid, signal.SIGKILL)
+        # run on complete callbacks
+        if self.__state == CALL_STATE_SUCCESS:
+            invoke_callback_sync(self.__onComplete, self.__fc_ret)
+        elif self.__state == CALL_STATE_ERROR:
+            invoke_callback_sync(self.__onError, self.__exception)
+        # clear the counter
+        if self.__counter is not None:
+            logger.debug("Decrementing process call counter: fid=%s", self.__fid)
+            self.__counter.decrement()
+
+
+def invoke_in_sp(max_concurrent_execs=-1, terminate_on_return=False, reuse_process=False):
     """
     Function decorator that turns any function into a multiprocessing one with ease
     :param max_concurrent_execs: Number of parallel executions allowed for this function
     :param terminate_on_return: Kill the sub-process after it returns, sub threads and everything will be terminated
+    :param reuse_process: Run calls in long-lived pooled worker sub-processes instead of a fresh one per call, the
+                          workers keep the module state they started with and arguments are pickled over a pipe
     """
 
     def decorator(function: Callable[..., R]) -> Callable[..., LMTTask]:
-        @wraps(function)
-        def wrapper(*args, **kwargs):
-            fid = id(function)
-            with PROCESS_CALL_COUNTER_LOCK:
-                if fid in PROCESS_CALL_COUNTER:
-                    if (PROCESS_CALL_COUNTER[fid] >= max_concurrent_execs) and max_concurrent_execs != -1:
-                        raise MaxConcurrentCallsLimitExceedException(
-                            f"Already running! Multiprocessing function {str(function)} only allows "
-                            f"{max_concurrent_execs} concurrent executions!")
-                    else:
-                        PROCESS_CALL_COUNTER[fid] += 1
-                else:
-                    PROCESS_CALL_COUNTER[fid] = 1
-            return LMTTask(MultiProcessedCall(function, fid, terminate_on_return, *args, **kwargs))
+        fid = id(function)
+        if max_concurrent_execs == -1:
+            # nothing to enforce, so uncapped calls never touch a counter
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                return LMTTask(MultiProcessedCall(function, fid, None, terminate_on_return, reuse_process, *args,
+                                                  **kwargs))
+        else:
+            # capped decorations of the same function share its counter, each checks it against its own limit
+            counter = get_call_counter(PROCESS_CALL_COUNTER, PROCESS_CALL_COUNTER_LOCK, function)
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not counter.try_increment(max_concurrent_execs):
+                    raise MaxConcurrentCallsLimitExceedException(
+                        f"Already running! Multiprocessing function {str(function)} only allows "
+                        f"{max_concurrent_execs} concurrent executions!")
+                return LMTTask(MultiProcessedCall(function, fid, counter, terminate_on_return, reuse_process, *args,
+                                                  **kwargs))
 
         return wrapper
 
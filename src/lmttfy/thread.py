@@ -1,15 +1,100 @@
-from .common import CALL_STATE_INCOMPLETE, CALL_STATE_SUCCESS, CALL_STATE_ERROR, R, pass_, invoke_callback_sync
+from .common import CALL_STATE_INCOMPLETE, CALL_STATE_SUCCESS, CALL_STATE_ERROR, R, pass_, invoke_callback_sync, \
+    backoff_delays, CallCounter, get_call_counter
 from .exceptions import MaxConcurrentCallsLimitExceedException, BurstWhileNoTaskErrorsException
 from .task import LMTTask
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 from functools import wraps
 import logging
+import os
+import queue
 import threading
 import time
 
+logger = logging.getLogger(__name__)
+
 # threading related global variables
+# the lock only guards creating the counter of a newly capped function, each counter synchronises itself
 FUN_CALL_COUNTER_LOCK = threading.Lock()
-FUN_CALL_COUNTER: dict[int, int] = {}
+FUN_CALL_COUNTER: dict[int, CallCounter] = {}
+
+# seconds an idle pooled worker thread waits for new work before exiting
+THREAD_POOL_IDLE_TIMEOUT: float = 60.0
+
+
+class _WorkerPool:
+    """
+    An elastic pool of daemon worker threads shared by every ThreadedCall.
+
+    A job is handed to an idle worker when one exists, otherwise a new worker is started, so calls never queue
+    behind each other (and a threaded function waiting on another can not deadlock the pool). Workers that stay
+    idle for THREAD_POOL_IDLE_TIMEOUT seconds exit, so the pool shrinks back after a burst.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__jobs: queue.SimpleQueue = queue.SimpleQueue()
+        # number of workers blocked on the job queue minus the jobs already queued for them
+        self.__idle: int = 0
+
+    def submit(self, function: Callable, *args, **kwargs) -> None:
+        """
+        Runs function(*args, **kwargs) on a pooled worker thread
+        """
+        job = (function, args, kwargs)
+        with self.__lock:
+            if self.__idle > 0:
+                self.__idle -= 1
+                self.__jobs.put(job)
+                return
+        threading.Thread(target=self.__work, args=(job,), daemon=True).start()
+
+    def reset(self) -> None:
+        """
+        Forgets all workers, used in a forked child where the parent's worker threads do not exist
+        """
+        self.__lock = threading.Lock()
+        self.__jobs = queue.SimpleQueue()
+        self.__idle = 0
+
+    def __work(self, job: tuple) -> None:
+        """
+        Worker thread loop, runs the initial job and then whatever gets queued until it idles out
+        """
+        while True:
+            function, args, kwargs = job
+            function(*args, **kwargs)
+            # drop references so finished calls are not kept alive while we idle
+            job = function = args = kwargs = None
+            with self.__lock:
+                self.__idle += 1
+            try:
+                job = self.__jobs.get(timeout=THREAD_POOL_IDLE_TIMEOUT)
+            except queue.Empty:
+                with self.__lock:
+                    # a job may have been queued for us between the timeout and taking the lock
+                    try:
+                        job = self.__jobs.get_nowait()
+                    except queue.Empty:
+                        self.__idle -= 1
+                        return
+
+
+_WORKER_POOL = _WorkerPool()
+
+
+def _reset_after_fork() -> None:
+    """
+    Gives a forked child fresh locks, idle counters and an empty worker pool, none of the parent's threads exist there
+    """
+    global FUN_CALL_COUNTER_LOCK
+    FUN_CALL_COUNTER_LOCK = threading.Lock()
+    for counter in FUN_CALL_COUNTER.values():
+        counter.reset()
+    _WORKER_POOL.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 class ThreadedCall:
@@ -18,29 +103,44 @@ class ThreadedCall:
     or raise the Exception that occurred in the thread to handle it properly
     """
 
-    def __init__(self, function, fid, *args, **kwargs):
+    __slots__ = ('__exception', '__fc_ret', '__state', '__fid', '__function', '__counter', '__onComplete', '__onError',
+                 '__result_set', '__done', 'thread', '__weakref__')
+
+    def __init__(self, function, fid, counter: Optional[CallCounter], reuse_thread: bool = False, /, *args, **kwargs):
         """
-        Initializes the ThreadedCall object
+        Initializes the ThreadedCall object, the leading parameters are positional-only so that any keyword argument
+        reaches the function
+        :param counter: Concurrency counter of the function, None when this call is uncapped
+        :param reuse_thread: Run on a pooled worker thread instead of starting a new thread for this call
         """
-        self.__exception: Exception = BurstWhileNoTaskErrorsException("Burst called with no error on threaded task")
-        self.__fid: int = 0
+        self.__exception: Optional[Exception] = None
         self.__fc_ret: object = None
         self.__state: int = CALL_STATE_INCOMPLETE
         self.__fid: int = fid
         self.__function: Callable = function
+        self.__counter: Optional[CallCounter] = counter
         self.__onComplete: Callable[[Any], None] = pass_
         self.__onError: Callable[[Any], None] = pass_
-        self.thread: threading.Thread = threading.Thread(target=self.__exe, args=args, kwargs=kwargs)
-        self.thread.daemon = True
-        self.thread.start()
-        logging.info('The function was executed in a separate thread: fid=%s', self.__fid)
+        # set as soon as the return value or exception is recorded, before callbacks run
+        self.__result_set: threading.Event = threading.Event()
+        # set once the call, its callbacks and the counter bookkeeping are all done
+        self.__done: threading.Event = threading.Event()
+        # a pooled worker thread goes on to run other calls, so it is not exposed as this call's thread
+        self.thread: Optional[threading.Thread] = None
+        if reuse_thread:
+            _WORKER_POOL.submit(self.__exe, *args, **kwargs)
+        else:
+            self.thread = threading.Thread(target=self.__exe, args=args, kwargs=kwargs)
+            self.thread.daemon = True
+            self.thread.start()
+        logger.debug('The function was executed in a separate thread: fid=%s', self.__fid)
 
     def on_complete(self, func: Callable, immediate_callback_if_done: bool = True):
         """
         Sets the function which gets passed the return value from the threaded function after it's done
         """
         self.__onComplete = func
-        if self.__state == CALL_STATE_SUCCESS and immediate_callback_if_done:
+        if self.__result_set.is_set() and self.__state == CALL_STATE_SUCCESS and immediate_callback_if_done:
             invoke_callback_sync(func, self.__fc_ret)
         return self
 
@@ -49,7 +149,7 @@ class ThreadedCall:
         Sets the function which will be called when the function call in the thread raises any unhandled exceptions.
         """
         self.__onError = func
-        if self.__state == CALL_STATE_ERROR and immediate_callback_if_done:
+        if self.__result_set.is_set() and self.__state == CALL_STATE_ERROR and immediate_callback_if_done:
             invoke_callback_sync(func, self.__exception)
         return self
 
@@ -57,18 +157,15 @@ class ThreadedCall:
         """
         Raises the captured exception during execution of the function in different thread
         """
+        if self.__exception is None:
+            raise BurstWhileNoTaskErrorsException("Burst called with no error on threaded task")
         raise self.__exception
 
     def wait(self, timeout: float = 0) -> Any:
         """
         Wait for the wrapped function to return or error-out
         """
-        if self.__state == CALL_STATE_INCOMPLETE:
-            # return or error is set when the wrapped function finishes execution, and thread dies at that point
-            if timeout > 0:
-                self.thread.join(timeout=timeout)
-            else:
-                self.thread.join()
+        self.__done.wait(timeout=timeout if timeout > 0 else None)
         return self.__fc_ret
 
     async def async_wait(self, timeout: float = 0) -> Any:
@@ -78,10 +175,11 @@ class ThreadedCall:
         deadline = None
         if timeout > 0:
             deadline = time.monotonic() + timeout
-        while self.__state == CALL_STATE_INCOMPLETE:
+        delays = backoff_delays(0.001, 0.05)
+        while not self.__done.is_set():
             if deadline is not None and time.monotonic() >= deadline:
                 return None
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(next(delays))
         return self.__fc_ret
 
     def __exe(self, *args, **kwargs) -> None:
@@ -90,45 +188,56 @@ class ThreadedCall:
         """
 
         try:
-            import asyncio, inspect
-            if inspect.iscoroutinefunction(self.__function):
-                self.__fc_ret = asyncio.run(self.__function(*args, **kwargs))
-            else:
-                self.__fc_ret = self.__function(*args, **kwargs)
-            logging.info("The internal func in thread returned successfully: fid=%s", self.__fid)
-            self.__state = CALL_STATE_SUCCESS
-            invoke_callback_sync(self.__onComplete, self.__fc_ret)
-        except Exception as e:
-            logging.info("The internal func in thread errored out: fid=%s", self.__fid)
-            self.__exception = e
-            self.__state = CALL_STATE_ERROR
-            invoke_callback_sync(self.__onError, self)
-        with FUN_CALL_COUNTER_LOCK:
-            if self.__fid in FUN_CALL_COUNTER and FUN_CALL_COUNTER[self.__fid] > 0:
-                logging.info("Decrementing thread call counter: fid=%s", self.__fid)
-                FUN_CALL_COUNTER[self.__fid] = FUN_CALL_COUNTER[self.__fid] - 1
-
-
-def invoke_in_thread(max_concurrent_execs=-1):
+            try:
+                import asyncio, inspect
+                if inspect.iscoroutinefunction(self.__function):
+                    self.__fc_ret = asyncio.run(self.__function(*args, **kwargs))
+                else:
+                    self.__fc_ret = self.__function(*args, **kwargs)
+                logger.debug("The internal func in thread returned successfully: fid=%s", self.__fid)
+                self.__state = CALL_STATE_SUCCESS
+                self.__result_set.set()
+                invoke_callback_sync(self.__onComplete, self.__fc_ret)
+            except Exception as e:
+                logger.debug("The internal func in thread errored out: fid=%s", self.__fid)
+                self.__exception = e
+                self.__state = CALL_STATE_ERROR
+                self.__result_set.set()
+                invoke_callback_sync(self.__onError, self.__exception)
+        finally:
+            if self.__counter is not None:
+                logger.debug("Decrementing thread call counter: fid=%s", self.__fid)
+                self.__counter.decrement()
+            # release waiters even if a callback raised
+            self.__done.set()
+
+
+def invoke_in_thread(max_concurrent_execs=-1, reuse_thread=False):
     """
     Function decorator to return an instance of ThreadedCall when a function is called
+    :param max_concurrent_execs: Number of parallel executions allowed for this function
+    :param reuse_thread: Run calls on pooled worker threads instead of a new thread per call, threading.local state
+                         then carries over between calls and ThreadedCall.thread is None
     """
 
     def decorator(function: Callable[..., R]) -> Callable[..., LMTTask]:
-        @wraps(function)
-        def wrapper(*args, **kwargs):
-            fid = id(function)
-            with FUN_CALL_COUNTER_LOCK:
-                if fid in FUN_CALL_COUNTER:
-                    if (FUN_CALL_COUNTER[fid] >= max_concurrent_execs) and max_concurrent_execs != -1:
-                        raise MaxConcurrentCallsLimitExceedException(
-                            f"Already running ! Threaded function {str(function)} only allows {max_concurrent_execs} "
-                            f"concurrent executions !")
-                    else:
-                        FUN_CALL_COUNTER[fid] = FUN_CALL_COUNTER[fid] + 1
-                else:
-                    FUN_CALL_COUNTER[fid] = 1
-            return LMTTask(ThreadedCall(function, fid, *args, **kwargs))
+        fid = id(function)
+        if max_concurrent_execs == -1:
+            # nothing to enforce, so uncapped calls never touch a counter
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                return LMTTask(ThreadedCall(function, fid, None, reuse_thread, *args, **kwargs))
+        else:
+            # capped decorations of the same function share its counter, each checks it against its own limit
+            counter = get_call_counter(FUN_CALL_COUNTER, FUN_CALL_COUNTER_LOCK, function)
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not counter.try_increment(max_concurrent_execs):
+                    raise MaxConcurrentCallsLimitExceedException(
+                        f"Already running ! Threaded function {str(function)} only allows {max_concurrent_execs} "
+                        f"concurrent executions !")
+                return LMTTask(ThreadedCall(function, fid, counter, reuse_thread, *args, **kwargs))
 
         return wrapper
 
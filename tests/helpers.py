@@ -6,4 +6,6 @@ from lmttfy._test_helpers import (  # noqa: F401
     async_sleep_n_add,
     raise_value_error,
     async_raise_value_error,
+    exit_abruptly,
+    raise_two_arg_error,
 )
@@ -1,13 +1,18 @@
 """Tests for :mod:`lmttfy.process` — :class:`MultiProcessedCall`."""
 
+import multiprocessing
+import os
+import time
+import weakref
 from typing import Any
 
 import pytest
 
-from lmttfy.process import invoke_in_sp
+from lmttfy import process
+from lmttfy.process import invoke_in_sp, SHARED_MEMORY_THRESHOLD
 from lmttfy.exceptions import MaxConcurrentCallsLimitExceedException, BurstWhileNoTaskErrorsException
 
-from tests.helpers import sleep_n_add, raise_value_error
+from tests.helpers import sleep_n_add, raise_value_error, exit_abruptly, raise_two_arg_error
 
 
 # basic smoke tests
@@ -43,6 +48,12 @@ class TestInvokeInSP:
         # a subsequent wait without timeout gets the value
         assert result.wait() == 3
 
+    def test_call_is_weak_referenceable(self):
+        """The call object behind the task still accepts weak references."""
+        result = invoke_in_sp()(sleep_n_add)(0, 1, 2)
+        assert weakref.ref(result._task)() is result._task
+        assert result.wait() == 3
+
 
 # error handling
 
@@ -85,6 +96,33 @@ class TestMultiProcessedCallErrors:
         assert isinstance(collected[0], ValueError)
         assert str(collected[0]) == "callback_err"
 
+    def test_callback_registered_while_another_runs(self):
+        """A callback registered while the previous one is still running fires immediately, it is not lost."""
+        f = invoke_in_sp()(sleep_n_add)
+        result = f(0.1, 40, 2)
+        got: list[Any] = []
+        result.on_complete(lambda _: time.sleep(0.5))
+        time.sleep(0.4)
+        result.on_complete(got.append)
+        result.wait()
+        assert got == [42]
+
+    def test_subprocess_exits_without_result(self):
+        """A sub-process that dies before replying surfaces a ChildProcessError instead of hanging."""
+        f = invoke_in_sp()(exit_abruptly)
+        result = f(3)
+        assert result.wait(timeout=10) is None
+        with pytest.raises(ChildProcessError, match="code 3"):
+            result.burst()
+
+    def test_reply_that_can_not_be_unpickled(self):
+        """A reply that fails to load becomes that call's error and later calls still complete."""
+        result = invoke_in_sp()(raise_two_arg_error)()
+        assert result.wait(timeout=10) is None
+        with pytest.raises(TypeError):
+            result.burst()
+        assert invoke_in_sp()(sleep_n_add)(0, 1, 2).wait(timeout=10) == 3
+
 
 # concurrency limiting
 
@@ -113,3 +151,119 @@ class TestMultiProcessedCallConcurrency:
 
         c2 = f(0.1, 3, 4)
         assert c2.wait() == 7
+
+    def test_keyword_arguments_reach_the_function(self):
+        """Capped calls pass every keyword argument through, whatever its name."""
+        f = invoke_in_sp(max_concurrent_execs=1)(dict)
+        assert f(_counter=1, counter=2, fid=3).wait(timeout=10) == {"_counter": 1, "counter": 2, "fid": 3}
+
+    def test_limit_shared_by_decorations_of_a_function(self):
+        """Decorating the same function again for every call still enforces the limit."""
+        def run():
+            return invoke_in_sp(max_concurrent_execs=1)(sleep_n_add)(0.5, 0, 0)
+
+        c1 = run()
+        with pytest.raises(MaxConcurrentCallsLimitExceedException):
+            run()
+        c1.wait()
+
+
+# worker process reuse
+
+class TestMultiProcessedCallPool:
+    """Pooled worker sub-processes are only reused when asked for."""
+
+    def test_fresh_process_per_call_by_default(self):
+        """Without reuse_process every call gets a sub-process of its own."""
+        f = invoke_in_sp()(os.getpid)
+        assert f().wait() != f().wait()
+
+    def test_worker_process_reused(self):
+        """Sequential reuse_process calls run in the same pooled sub-process."""
+        f = invoke_in_sp(reuse_process=True)(os.getpid)
+        first = f().wait()
+        second = f().wait()
+        assert first != os.getpid()
+        assert first == second
+
+    def test_pooled_call_has_no_process(self):
+        """A shared worker sub-process is not exposed as the call's process."""
+        result = invoke_in_sp(reuse_process=True)(sleep_n_add)(0, 1, 2)
+        assert result.wait() == 3
+        assert result._task.process is None
+
+    def test_terminate_on_return_uses_fresh_process(self):
+        """terminate_on_return calls never reuse a sub-process."""
+        f = invoke_in_sp(terminate_on_return=True, reuse_process=True)(os.getpid)
+        assert f().wait() != f().wait()
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                        reason="Only forked workers can miss functions defined after they started")
+    def test_function_defined_after_pool_started(self):
+        """A job the pooled worker can not load is re-run in a dedicated sub-process."""
+        invoke_in_sp(reuse_process=True)(os.getpid)().wait()
+
+        def late_defined_func():
+            return "late"
+
+        late_defined_func.__module__ = __name__
+        late_defined_func.__qualname__ = "late_defined_func"
+        globals()["late_defined_func"] = late_defined_func
+        try:
+            assert invoke_in_sp(reuse_process=True)(late_defined_func)().wait(timeout=10) == "late"
+        finally:
+            del globals()["late_defined_func"]
+
+# result dispatching
+
+class TestResultDispatcher:
+    """The dispatcher threads keep delivering results."""
+
+    def test_more_calls_than_one_thread_waits_on(self, monkeypatch):
+        """Calls beyond what a single dispatcher thread waits on are served by additional threads."""
+        monkeypatch.setattr(process, "_WAIT_BATCH_SIZE", 2)
+        f = invoke_in_sp()(sleep_n_add)
+        calls = [f(0.2, i, 0) for i in range(7)]
+        assert [c.wait(timeout=10) for c in calls] == list(range(7))
+
+    def test_broken_connection_fails_only_its_call(self):
+        """A connection that can not be waited on is dropped with an error instead of wedging the dispatcher."""
+        got = []
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        parent_conn.close()
+        child_conn.close()
+        process._RESULT_DISPATCHER.register(parent_conn, got.append)
+        assert invoke_in_sp()(sleep_n_add)(0, 1, 2).wait(timeout=10) == 3
+        deadline = time.monotonic() + 5
+        while not got and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(got) == 1 and got[0][0] == "exception_set"
+
+
+# large results
+
+class TestMultiProcessedCallSharedMemory:
+    """Large buffer results travel through shared memory and come back intact."""
+
+    def test_large_bytes_result(self):
+        """A bytes result above the threshold is returned unchanged."""
+        f = invoke_in_sp()(bytes)
+        result = f(SHARED_MEMORY_THRESHOLD)
+        assert result.wait() == bytes(SHARED_MEMORY_THRESHOLD)
+
+    def test_large_bytearray_result(self):
+        """A bytearray result keeps its type."""
+        f = invoke_in_sp()(bytearray)
+        ret = f(SHARED_MEMORY_THRESHOLD).wait()
+        assert type(ret) is bytearray
+        assert len(ret) == SHARED_MEMORY_THRESHOLD
+
+    def test_large_numpy_result(self):
+        """A numpy array result keeps its shape, dtype and contents."""
+        np = pytest.importorskip("numpy")
+        f = invoke_in_sp()(np.arange)
+        n = SHARED_MEMORY_THRESHOLD // 4 + 1
+        ret = f(n, dtype=np.float32).wait()
+        assert ret.dtype == np.float32
+        assert ret.shape == (n,)
+        assert ret[-1] == n - 1
@@ -17,21 +17,21 @@ class TestLMTTaskWrapper:
 
     def test_wraps_threaded_call(self):
         """LMTTask wrapping a ThreadedCall returns the right result via wait()."""
-        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), 0.05, 10, 20)
+        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), None, False, 0.05, 10, 20)
         task = LMTTask(tc)
         assert task.wait() == 30
         assert isinstance(task._task, ThreadedCall)
 
     def test_wraps_multi_processed_call(self):
         """LMTTask wrapping a MultiProcessedCall returns the right result via wait()."""
-        mp = MultiProcessedCall(sleep_n_add, id(sleep_n_add), False, 0.05, 100, 200)
+        mp = MultiProcessedCall(sleep_n_add, id(sleep_n_add), None, False, False, 0.05, 100, 200)
         task = LMTTask(mp)
         assert task.wait() == 300
         assert isinstance(task._task, MultiProcessedCall)
 
     def test_burst_delegates(self):
         """LMTTask.burst() raises the captured exception from the inner task."""
-        tc = ThreadedCall(raise_value_error, id(raise_value_error), "nope")
+        tc = ThreadedCall(raise_value_error, id(raise_value_error), None, False, "nope")
         task = LMTTask(tc)
         task.wait()
         with pytest.raises(ValueError, match="nope"):
@@ -39,7 +39,7 @@ class TestLMTTaskWrapper:
 
     def test_burst_before_error(self):
         """LMTTask.burst() raises BurstWhileNoTaskErrorsException when no error."""
-        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), 0.05, 1, 2)
+        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), None, False, 0.05, 1, 2)
         task = LMTTask(tc)
         task.wait()
         with pytest.raises(BurstWhileNoTaskErrorsException):
@@ -47,7 +47,7 @@ class TestLMTTaskWrapper:
 
     def test_on_complete_delegates(self):
         """LMTTask.on_complete() fires the callback via the inner task."""
-        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), 0.05, 1, 2)
+        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), None, False, 0.05, 1, 2)
         task = LMTTask(tc)
         collected: list[Any] = []
         task.on_complete(collected.append)
@@ -56,7 +56,7 @@ class TestLMTTaskWrapper:
 
     def test_on_error_delegates(self):
         """LMTTask.on_error() fires the callback via the inner task."""
-        tc = ThreadedCall(raise_value_error, id(raise_value_error), "bad")
+        tc = ThreadedCall(raise_value_error, id(raise_value_error), None, False, "bad")
         task = LMTTask(tc)
         collected: list[Any] = []
         task.on_error(lambda e: collected.append(e))
@@ -65,14 +65,14 @@ class TestLMTTaskWrapper:
 
     def test_chaining(self):
         """LMTTask.on_complete() and on_error() return self for chaining."""
-        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), 0.05, 1, 2)
+        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), None, False, 0.05, 1, 2)
         task = LMTTask(tc)
         assert task.on_complete(print) is task
         assert task.on_error(print) is task
 
     def test_wait_timeout(self):
         """LMTTask.wait(timeout=…) delegates correctly."""
-        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), 2, 1, 2)
+        tc = ThreadedCall(sleep_n_add, id(sleep_n_add), None, False, 2, 1, 2)
         task = LMTTask(tc)
         assert task.wait(timeout=0.01) is None  # still running
         assert task.wait() == 3  # now complete
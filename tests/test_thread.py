@@ -1,5 +1,9 @@
 """Tests for :mod:`lmttfy.thread` — :class:`ThreadedCall`."""
 
+import os
+import threading
+import time
+import weakref
 from typing import Any
 
 import pytest
@@ -43,6 +47,12 @@ class TestInvokeInThread:
         # a subsequent wait without timeout gets the value
         assert result.wait() == 3
 
+    def test_call_is_weak_referenceable(self):
+        """The call object behind the task still accepts weak references."""
+        result = invoke_in_thread()(sleep_n_add)(0, 1, 2)
+        assert weakref.ref(result._task)() is result._task
+        assert result.wait() == 3
+
 
 # error handling
 
@@ -85,6 +95,17 @@ class TestThreadedCallErrors:
         assert isinstance(collected[0], ValueError)
         assert str(collected[0]) == "callback_err"
 
+    def test_callback_registered_while_another_runs(self):
+        """A callback registered while the previous one is still running fires immediately, it is not lost."""
+        f = invoke_in_thread()(sleep_n_add)
+        result = f(0.1, 40, 2)
+        got: list[Any] = []
+        result.on_complete(lambda _: time.sleep(0.5))
+        time.sleep(0.3)
+        result.on_complete(got.append)
+        result.wait()
+        assert got == [42]
+
 
 # concurrency limiting
 
@@ -117,3 +138,82 @@ class TestThreadedCallConcurrency:
         # now a new call should succeed
         c2 = f(0.1, 3, 4)
         assert c2.wait() == 7
+
+    def test_keyword_arguments_reach_the_function(self):
+        """Capped calls pass every keyword argument through, whatever its name."""
+        f = invoke_in_thread(max_concurrent_execs=1)(dict)
+        assert f(_counter=1, counter=2, fid=3).wait(timeout=10) == {"_counter": 1, "counter": 2, "fid": 3}
+
+    def test_limit_shared_by_decorations_of_a_function(self):
+        """Decorating the same function again for every call still enforces the limit."""
+        def run():
+            return invoke_in_thread(max_concurrent_execs=1)(sleep_n_add)(0.5, 0, 0)
+
+        c1 = run()
+        with pytest.raises(MaxConcurrentCallsLimitExceedException):
+            run()
+        c1.wait()
+
+    def test_uncapped_decoration_does_not_touch_limit(self):
+        """Uncapped decorations of the same function neither consume nor release another decoration's slots."""
+        capped = invoke_in_thread(max_concurrent_execs=1)(sleep_n_add)
+        uncapped = invoke_in_thread()(sleep_n_add)
+
+        c1 = capped(1, 0, 0)
+        for c in [uncapped(0.05, 0, 0) for _ in range(3)]:
+            c.wait()
+
+        # the finished uncapped calls must not have freed the capped slot
+        with pytest.raises(MaxConcurrentCallsLimitExceedException):
+            capped(1, 0, 0)
+
+        c1.wait()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_starts_with_free_slots(self):
+        """A forked child does not inherit the parent's in-flight calls or pooled workers."""
+        f = invoke_in_thread(max_concurrent_execs=1)(sleep_n_add)
+        c1 = f(1, 0, 0)
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os._exit(0 if f(0.01, 1, 2).wait(timeout=5) == 3 else 1)
+            except BaseException:
+                os._exit(2)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+        c1.wait()
+
+
+# worker pool
+
+class TestThreadedCallPool:
+    """Pooled worker threads behave like a dedicated thread per call."""
+
+    def test_dedicated_thread_by_default(self):
+        """Without reuse_thread each call runs on its own thread, exposed as .thread."""
+        f = invoke_in_thread()(threading.get_ident)
+        t1, t2 = f(), f()
+        assert t1.wait() == t1._task.thread.ident
+        assert t2.wait() == t2._task.thread.ident
+        assert t1._task.thread is not t2._task.thread
+
+    def test_pooled_call_has_no_thread(self):
+        """A shared worker thread is not exposed as the call's thread."""
+        result = invoke_in_thread(reuse_thread=True)(sleep_n_add)(0, 1, 2)
+        assert result.wait() == 3
+        assert result._task.thread is None
+
+    def test_nested_calls_do_not_deadlock(self):
+        """A threaded function can wait on other threaded calls without starving the pool."""
+        inner = invoke_in_thread(reuse_thread=True)(sleep_n_add)
+
+        @invoke_in_thread(reuse_thread=True)
+        def outer(n):
+            return sum(inner(0.05, i, 0).wait() for i in range(n))
+
+        calls = [outer(5) for _ in range(50)]
+        for c in calls:
+            assert c.wait(timeout=10) == 10